@@ -0,0 +1,141 @@
+"""Initial schema with composite and trigram indexes.
+
+Captures the current model state (products, admins, upload_history) and
+adds the composite indexes used by the product list endpoints. On
+PostgreSQL it also enables the pg_trgm extension and creates GIN trigram
+indexes so the ILIKE '%term%' search in /products/search can use a
+bitmap index scan instead of a sequential scan.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-08-31
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create tables and indexes."""
+    op.create_table(
+        "products",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("price", sa.DECIMAL(precision=10, scale=2), nullable=False),
+        sa.Column("category", sa.String(length=100), nullable=True),
+        sa.Column("brand", sa.String(length=100), nullable=True),
+        sa.Column("sku", sa.String(length=100), nullable=True),
+        sa.Column("stock_quantity", sa.Integer(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("image_url", sa.Text(), nullable=True),
+        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("sku"),
+    )
+    op.create_index("ix_products_id", "products", ["id"])
+    op.create_index("ix_products_name", "products", ["name"])
+    op.create_index("ix_products_category", "products", ["category"])
+    op.create_index("ix_products_sku", "products", ["sku"])
+    op.create_index("ix_products_is_active", "products", ["is_active"])
+    op.create_index("idx_product_name_category", "products", ["name", "category"])
+    op.create_index("idx_product_price_active", "products", ["price", "is_active"])
+    op.create_index("idx_product_created_at", "products", ["created_at"])
+    op.create_index(
+        "ix_product_active_created",
+        "products",
+        ["is_active", sa.text("created_at DESC")],
+    )
+    op.create_index("ix_product_active_category", "products", ["is_active", "category"])
+    op.create_index("ix_product_active_brand", "products", ["is_active", "brand"])
+
+    op.create_table(
+        "admins",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("username", sa.String(length=50), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("last_login", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("username"),
+        sa.UniqueConstraint("email"),
+    )
+    op.create_index("ix_admins_id", "admins", ["id"])
+    op.create_index("ix_admins_username", "admins", ["username"])
+    op.create_index("ix_admins_email", "admins", ["email"])
+
+    op.create_table(
+        "upload_history",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("admin_id", sa.String(length=36), nullable=False),
+        sa.Column("admin_username", sa.String(length=50), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=False),
+        sa.Column("total_rows", sa.Integer(), nullable=True),
+        sa.Column("successful_rows", sa.Integer(), nullable=True),
+        sa.Column("failed_rows", sa.Integer(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("error_details", sa.JSON(), nullable=True),
+        sa.Column(
+            "uploaded_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_upload_history_id", "upload_history", ["id"])
+    op.create_index("ix_upload_history_admin_id", "upload_history", ["admin_id"])
+
+    # Trigram indexes for the substring search (PostgreSQL only)
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_product_name_trgm",
+            "products",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+        op.create_index(
+            "ix_product_description_trgm",
+            "products",
+            ["description"],
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Drop tables and indexes."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_product_description_trgm", table_name="products")
+        op.drop_index("ix_product_name_trgm", table_name="products")
+
+    op.drop_table("upload_history")
+    op.drop_table("admins")
+    op.drop_table("products")
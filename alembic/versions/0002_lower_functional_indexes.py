@@ -0,0 +1,31 @@
+"""Functional lower() indexes for category/brand equality filters.
+
+The category/brand filters now compare lower(column) = lower(:value)
+instead of ILIKE '%value%', so the planner needs expression indexes on
+lower(category) and lower(brand).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-08-31
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create lower() expression indexes."""
+    op.create_index("ix_product_category_lower", "products", [sa.text("lower(category)")])
+    op.create_index("ix_product_brand_lower", "products", [sa.text("lower(brand)")])
+
+
+def downgrade() -> None:
+    """Drop lower() expression indexes."""
+    op.drop_index("ix_product_brand_lower", table_name="products")
+    op.drop_index("ix_product_category_lower", table_name="products")
@@ -0,0 +1,46 @@
+"""Materialized category_counts summary table.
+
+/products/categories now reads per-category counts from this table
+instead of running a GROUP BY over products on every request. The
+application rebuilds it after catalog mutations and at startup.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-08-31
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the category_counts table and seed it."""
+    op.create_table(
+        "category_counts",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.execute(
+        "INSERT INTO category_counts (name, count) "
+        "SELECT category, COUNT(id) FROM products "
+        "WHERE is_active AND category IS NOT NULL AND category != '' "
+        "GROUP BY category"
+    )
+
+
+def downgrade() -> None:
+    """Drop the category_counts table."""
+    op.drop_table("category_counts")
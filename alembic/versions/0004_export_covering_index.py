@@ -0,0 +1,34 @@
+"""Covering index for the filtered, ordered export query.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-08-31
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the (is_active, category, brand, created_at DESC) index."""
+    kwargs = {}
+    if op.get_bind().dialect.name == "postgresql":
+        kwargs["postgresql_where"] = sa.text("is_active")
+
+    op.create_index(
+        "idx_product_active_cat_brand_created",
+        "products",
+        ["is_active", "category", "brand", sa.text("created_at DESC")],
+        **kwargs,
+    )
+
+
+def downgrade() -> None:
+    """Drop the export covering index."""
+    op.drop_index("idx_product_active_cat_brand_created", table_name="products")
@@ -0,0 +1,42 @@
+"""Generated tsvector column and GIN index for product search.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-08-31
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the search_vector generated column and its GIN index.
+
+    PostgreSQL only - SQLite has no tsvector type, and the search code
+    falls back to ILIKE on other dialects.
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE products ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('spanish', "
+        "coalesce(name, '') || ' ' || coalesce(description, ''))) STORED"
+    )
+    op.execute(
+        "CREATE INDEX products_search_idx ON products USING GIN (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the full-text search column and index."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX products_search_idx")
+    op.execute("ALTER TABLE products DROP COLUMN search_vector")
@@ -0,0 +1,34 @@
+"""Partial price index for active-catalog price filters.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-08-31
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the price index, partial on is_active where supported."""
+    kwargs = {}
+    if op.get_bind().dialect.name == "postgresql":
+        kwargs["postgresql_where"] = sa.text("is_active")
+
+    op.create_index(
+        "idx_product_active_price",
+        "products",
+        ["price"],
+        **kwargs,
+    )
+
+
+def downgrade() -> None:
+    """Drop the partial price index."""
+    op.drop_index("idx_product_active_price", table_name="products")
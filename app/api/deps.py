@@ -1,33 +1,59 @@
 """API dependencies for dependency injection."""
 
 from typing import Generator, Optional
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_get, cache_set
+from app.core.config import get_settings
 from app.core.database import get_db
-from app.core.security import verify_token
+from app.core.security import decode_token
 from app.models.admin import Admin
 
+settings = get_settings()
+
 # Security scheme for JWT tokens
 security = HTTPBearer()
 
+# Verified token -> detached Admin snapshot, so requests that need the
+# full DB row (or legacy tokens without admin claims) skip the
+# per-request admins lookup. The short TTL bounds how long a
+# deactivated admin can keep using a live token.
+_admin_cache: TTLCache = TTLCache(
+    maxsize=10_000,
+    ttl=min(60, settings.access_token_expire_minutes * 60)
+)
+
+
+class AdminPrincipal(BaseModel):
+    """Authenticated admin identity derived from JWT claims."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: str
+    username: str
+    is_active: bool
+
+
+def _credentials_error() -> HTTPException:
+    """Build the standard 401 for invalid credentials."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _lookup_admin(token: str, username: str, db: Session) -> Admin:
+    """Load the admin row for a verified token, via the TTL cache."""
+    admin = cache_get(_admin_cache, token)
+    if admin is not None:
+        return admin
 
-def get_current_admin(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> Admin:
-    """Get current authenticated admin user."""
-    token = credentials.credentials
-    username = verify_token(token)
-    
-    if username is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
     admin = db.query(Admin).filter(Admin.username == username).first()
     if admin is None:
         raise HTTPException(
@@ -35,20 +61,79 @@ def get_current_admin(
             detail="Admin not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
     if not admin.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive admin account"
         )
-    
+
+    # Detach from the session so the snapshot stays usable after this
+    # request's session closes
+    db.expunge(admin)
+    cache_set(_admin_cache, token, admin)
+
     return admin
 
 
-def get_current_active_admin(
-    current_admin: Admin = Depends(get_current_admin)
+def get_current_admin(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> AdminPrincipal:
+    """Get current authenticated admin identity.
+
+    Tokens issued by admin_login carry the admin id and active flag as
+    claims, so the steady state needs no database query. Legacy tokens
+    without those claims fall back to the cached DB lookup.
+    """
+    token = credentials.credentials
+    payload = decode_token(token)
+
+    if payload is None or payload.get("sub") is None:
+        raise _credentials_error()
+
+    if payload.get("aid") is not None:
+        if not payload.get("act", False):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Inactive admin account"
+            )
+        return AdminPrincipal(
+            id=payload["aid"],
+            username=payload["sub"],
+            is_active=True
+        )
+
+    admin = _lookup_admin(token, payload["sub"], db)
+    return AdminPrincipal(
+        id=str(admin.id),
+        username=admin.username,
+        is_active=admin.is_active
+    )
+
+
+def get_current_admin_from_db(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
 ) -> Admin:
-    """Get current active admin user."""
+    """Get the current admin's database row.
+
+    Slow path for endpoints that need fresh admin fields (e.g. /me);
+    everything else should depend on get_current_active_admin.
+    """
+    token = credentials.credentials
+    payload = decode_token(token)
+
+    if payload is None or payload.get("sub") is None:
+        raise _credentials_error()
+
+    return _lookup_admin(token, payload["sub"], db)
+
+
+def get_current_active_admin(
+    current_admin: AdminPrincipal = Depends(get_current_admin)
+) -> AdminPrincipal:
+    """Get current active admin identity."""
     if not current_admin.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
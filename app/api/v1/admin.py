@@ -1,71 +1,135 @@
 """Admin API endpoints - Authentication required."""
 
-from datetime import datetime, timedelta
+import logging
+from datetime import timedelta
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status, UploadFile, File, Form
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, desc, func
 
-from app.core.database import get_db
-from app.core.security import verify_password, create_access_token, get_password_hash
+from app.core.cache import bump_catalog_version, cache_get, cache_set, get_catalog_version, response_cache
+from app.core.database import get_db, SessionLocal
+from app.core.limiter import limiter
+from app.core.security import (
+    verify_password,
+    create_access_token,
+    dummy_verify,
+    get_password_hash,
+    password_needs_rehash
+)
 from app.core.config import get_settings
-from app.api.deps import get_current_active_admin
+from app.api.deps import AdminPrincipal, get_current_active_admin, get_current_admin_from_db
 from app.models.admin import Admin, UploadHistory
 from app.models.product import Product
 from app.schemas.admin import (
     AdminResponse,
     TokenResponse,
+    UploadAccepted,
     UploadHistoryResponse,
     UploadHistoryListResponse
 )
 from app.schemas.product import (
+    PRODUCT_LIST_ADAPTER,
     ProductResponse,
     ProductListResponse,
-    ProductUpdate,
-    ExcelImportResult
+    ProductUpdate
 )
 from app.services.excel_processor import ExcelProcessor
 from app.services.excel_exporter import ExcelExporter
+from app.services.product_service import listing_filters, refresh_category_counts
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 router = APIRouter()
 
+# Built once at import time - raising the same instance avoids
+# re-allocating the exception on every failure, and constant details do
+# not leak internal error messages to clients
+_product_not_found = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="Product not found"
+)
+_upload_not_found = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="Upload not found"
+)
+_update_failed = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Failed to update product"
+)
+_delete_failed = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Failed to delete product"
+)
+_export_failed = HTTPException(
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    detail="Failed to generate Excel file"
+)
+_bad_credentials = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Incorrect username or password",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+# Recent failed login attempts per (username, client IP). Once an entry
+# crosses the threshold further attempts are rejected without running
+# the password KDF, so credential stuffing cannot burn worker CPU.
+_login_failures = TTLCache(maxsize=10_000, ttl=60)
+_login_failure_threshold = 5
+
 
 @router.post("/login", response_model=TokenResponse)
-async def admin_login(
+@limiter.limit("5/minute")
+def admin_login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
     """Admin login endpoint."""
-    
+
+    failure_key = (form_data.username, request.client.host if request.client else "")
+    if cache_get(_login_failures, failure_key, 0) >= _login_failure_threshold:
+        raise _bad_credentials
+
     # Find admin by username
     admin = db.query(Admin).filter(Admin.username == form_data.username).first()
-    
+
+    if admin is None:
+        # Burn the same verification cost for unknown usernames so the
+        # response time does not reveal which accounts exist
+        dummy_verify()
+
     if not admin or not verify_password(form_data.password, admin.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+        cache_set(_login_failures, failure_key, cache_get(_login_failures, failure_key, 0) + 1)
+        raise _bad_credentials
+
     if not admin.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive admin account"
         )
     
-    # Update last login
-    admin.last_login = datetime.utcnow()
+    # Migrate legacy bcrypt hashes to Argon2id on successful login
+    if password_needs_rehash(admin.hashed_password):
+        admin.hashed_password = get_password_hash(form_data.password)
+
+    # Update last login with a DB-side timestamp
+    admin.last_login = func.now()
     db.commit()
     
     # Create access token
     access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        subject=admin.username, expires_delta=access_token_expires
+        subject=admin.username,
+        expires_delta=access_token_expires,
+        # Carried as claims so authenticated requests skip the DB lookup
+        extra_claims={"aid": str(admin.id), "act": admin.is_active}
     )
     
     return TokenResponse(
@@ -77,137 +141,179 @@ async def admin_login(
 
 @router.get("/me", response_model=AdminResponse)
 async def get_current_admin_info(
-    current_admin: Admin = Depends(get_current_active_admin)
+    current_admin: Admin = Depends(get_current_admin_from_db)
 ):
     """Get current admin information."""
     return current_admin
 
 
 @router.get("/products/", response_model=ProductListResponse)
-async def get_all_products(
+def get_all_products(
     include_inactive: bool = False,
     category: Optional[str] = None,
     page: int = 1,
     size: int = 20,
     db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_active_admin)
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
 ):
     """Get all products (including inactive ones for admin)."""
-    
-    # Build query
-    query = db.query(Product)
-    
-    if not include_inactive:
-        query = query.filter(Product.is_active == True)
-    
-    if category:
-        query = query.filter(Product.category.ilike(f"%{category}%"))
-    
-    # Order by created date (newest first)
-    query = query.order_by(Product.created_at.desc())
-    
-    # Get total count
-    total = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * size
-    products = query.offset(offset).limit(size).all()
-    
-    # Calculate total pages
-    pages = (total + size - 1) // size
-    
-    return ProductListResponse(
-        items=products,
-        total=total,
-        page=page,
-        size=size,
-        pages=pages
-    )
+
+    # Same version-keyed response cache as the public listing - the
+    # admin dashboard polls this endpoint far more often than the
+    # catalog changes
+    cache_key = ("admin-products", get_catalog_version(), include_inactive, category, page, size)
+    payload = cache_get(response_cache, cache_key)
+    if payload is None:
+        # Build query over the plain table - the listing is read-only,
+        # so ORM instrumentation is skipped
+        query = db.query(Product.__table__)
+
+        filters = listing_filters(include_inactive=include_inactive, category=category)
+        if filters:
+            query = query.filter(*filters)
+
+        # Order by created date (newest first)
+        query = query.order_by(Product.created_at.desc())
+
+        # Fetch page and total in a single round trip via a window function
+        offset = (page - 1) * size
+        rows = query.add_columns(
+            func.count().over().label('total')
+        ).offset(offset).limit(size).all()
+
+        if rows:
+            products = [row._mapping for row in rows]
+            total = rows[0].total
+        else:
+            products = []
+            total = query.count() if page > 1 else 0
+
+        # Calculate total pages
+        pages = (total + size - 1) // size
+
+        payload = ProductListResponse.model_construct(
+            items=PRODUCT_LIST_ADAPTER.validate_python(products, from_attributes=True),
+            total=total,
+            page=page,
+            size=size,
+            pages=pages
+        ).model_dump_json()
+        cache_set(response_cache, cache_key, payload)
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.put("/products/{product_id}", response_model=ProductResponse)
-async def update_product(
+def update_product(
     product_id: str,
     product_update: ProductUpdate,
     db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_active_admin)
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
 ):
     """Update a product."""
     
     # Find product
     product = db.query(Product).filter(Product.id == product_id).first()
     if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found"
-        )
-    
+        raise _product_not_found
+
     # Update fields
-    update_data = product_update.dict(exclude_unset=True)
+    update_data = product_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(product, field, value)
-    
-    # Update timestamp
-    product.updated_at = datetime.utcnow()
-    
+
+    # updated_at is maintained by the column's onupdate=func.now()
+
     try:
         db.commit()
-        db.refresh(product)
+        refresh_category_counts(db)
+        db.commit()
+        bump_catalog_version()
         return product
     except Exception as e:
         db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to update product: {str(e)}"
-        )
+        logger.error(f"Failed to update product {product_id}: {e}")
+        raise _update_failed
 
 
 @router.delete("/products/{product_id}")
-async def delete_product(
+def delete_product(
     product_id: UUID,
     db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_active_admin)
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
 ):
     """Soft delete a product (set is_active to False)."""
     
     # Find product
     product = db.query(Product).filter(Product.id == product_id).first()
     if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found"
-        )
-    
-    # Soft delete
+        raise _product_not_found
+
+    # Soft delete - updated_at is maintained by onupdate=func.now()
     product.is_active = False
-    product.updated_at = datetime.utcnow()
-    
+
     try:
         db.commit()
+        refresh_category_counts(db)
+        db.commit()
+        bump_catalog_version()
         return {"message": "Product deleted successfully"}
     except Exception as e:
         db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to delete product: {str(e)}"
-        )
+        logger.error(f"Failed to delete product {product_id}: {e}")
+        raise _delete_failed
+
+
+def _process_upload_job(upload_id: str, content: bytes, filename: str, admin_username: str):
+    """Background job: import an uploaded Excel file and record the result."""
+
+    db = SessionLocal()
+    try:
+        upload_record = db.query(UploadHistory).filter(UploadHistory.id == upload_id).first()
+
+        try:
+            processor = ExcelProcessor(db)
+            result = processor.process_excel_content(content, filename, admin_username)
 
+            upload_record.total_rows = result.total_rows
+            upload_record.successful_rows = result.successful_rows
+            upload_record.failed_rows = result.failed_rows
+            upload_record.status = "success" if result.failed_rows == 0 else ("partial" if result.successful_rows > 0 else "failed")
+            upload_record.error_details = {"errors": result.errors, "warnings": result.warnings} if result.errors or result.warnings else None
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Background Excel import failed for upload {upload_id}: {e}")
+            upload_record.status = "failed"
+            upload_record.error_details = {"error": str(e)}
 
-@router.post("/upload-excel", response_model=ExcelImportResult)
+        refresh_category_counts(db)
+        db.commit()
+        bump_catalog_version()
+    finally:
+        db.close()
+
+
+@router.post("/upload-excel", response_model=UploadAccepted, status_code=status.HTTP_202_ACCEPTED)
 async def upload_excel_file(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_active_admin)
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
 ):
-    """Upload Excel file to update products."""
-    
+    """Upload Excel file to update products.
+
+    The file is validated and accepted immediately; parsing and the
+    bulk import run as a background task. Poll /upload-status/{id} for
+    the outcome.
+    """
+
     # Validate file
     if not file.filename:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No file provided"
         )
-    
+
     # Check file extension
     file_ext = file.filename.lower().split('.')[-1]
     if f".{file_ext}" not in settings.allowed_extensions_list:
@@ -215,94 +321,88 @@ async def upload_excel_file(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File type not allowed. Allowed types: {settings.allowed_extensions}"
         )
-    
+
     # Check file size
     if file.size and file.size > settings.max_file_size:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File too large. Maximum size: {settings.max_file_size} bytes"
         )
-    
-    try:
-        # Process Excel file
-        processor = ExcelProcessor(db)
-        result = await processor.process_excel_file(file, current_admin)
-        
-        # Record upload history
-        upload_record = UploadHistory(
-            admin_id=current_admin.id,
-            admin_username=current_admin.username,
-            filename=file.filename,
-            total_rows=result.total_rows,
-            successful_rows=result.successful_rows,
-            failed_rows=result.failed_rows,
-            status="success" if result.failed_rows == 0 else ("partial" if result.successful_rows > 0 else "failed"),
-            error_details={"errors": result.errors, "warnings": result.warnings} if result.errors or result.warnings else None
-        )
-        
-        db.add(upload_record)
-        db.commit()
-        
-        return result
-        
-    except Exception as e:
-        # Record failed upload
-        upload_record = UploadHistory(
-            admin_id=current_admin.id,
-            admin_username=current_admin.username,
-            filename=file.filename,
-            total_rows=0,
-            successful_rows=0,
-            failed_rows=0,
-            status="failed",
-            error_details={"error": str(e)}
-        )
-        
-        db.add(upload_record)
-        db.commit()
-        
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process Excel file: {str(e)}"
-        )
+
+    content = await file.read()
+
+    # Record the upload up front so its status can be polled
+    upload_record = UploadHistory(
+        admin_id=current_admin.id,
+        admin_username=current_admin.username,
+        filename=file.filename,
+        status="processing"
+    )
+    db.add(upload_record)
+    db.commit()
+
+    background_tasks.add_task(
+        _process_upload_job,
+        upload_record.id,
+        content,
+        file.filename,
+        current_admin.username
+    )
+
+    return UploadAccepted(
+        upload_id=upload_record.id,
+        filename=file.filename,
+        status="processing"
+    )
+
+
+@router.get("/upload-status/{upload_id}", response_model=UploadHistoryResponse)
+def get_upload_status(
+    upload_id: UUID,
+    db: Session = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
+):
+    """Get the status of an Excel upload."""
+
+    upload_record = db.query(UploadHistory).filter(
+        UploadHistory.id == str(upload_id)
+    ).first()
+
+    if not upload_record:
+        raise _upload_not_found
+
+    return upload_record
 
 
 @router.get("/download-excel")
-async def download_excel_products(
+def download_excel_products(
     include_inactive: bool = False,
     category: Optional[str] = None,
     brand: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_active_admin)
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
 ):
     """Download all products as Excel file."""
     
     try:
         # Create Excel exporter
         exporter = ExcelExporter(db)
-        
-        # Generate Excel file content
-        excel_content = exporter.export_products_to_excel(
-            include_inactive=include_inactive,
-            category_filter=category,
-            brand_filter=brand
-        )
-        
+
         # Generate filename
         filename = exporter.generate_filename(include_inactive=include_inactive)
-        
-        # Create streaming response
-        def iterfile():
-            yield excel_content
-        
+
+        # Stream the workbook in chunks instead of materializing the
+        # whole file in memory
         return StreamingResponse(
-            iterfile(),
+            exporter.export_products_stream(
+                include_inactive=include_inactive,
+                category_filter=category,
+                brand_filter=brand
+            ),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
         
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate Excel file: {str(e)}"
-        )
+        logger.error(f"Failed to generate Excel export: {e}")
+        raise _export_failed
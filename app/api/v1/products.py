@@ -1,15 +1,26 @@
 """Product API endpoints - Public access."""
 
+import hashlib
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
 
+from app.core.cache import cache_get, cache_set, response_cache, get_catalog_version
 from app.core.database import get_db
-from app.models.product import Product
+from app.models.product import CategoryCount, Product
+from app.services.product_service import (
+    fts_enabled,
+    fts_match,
+    fts_rank,
+    ilike_pattern,
+    listing_filters
+)
 from app.schemas.product import (
-    ProductResponse, 
+    PRODUCT_LIST_ADAPTER,
+    ProductResponse,
     ProductListResponse,
     ProductSearchQuery,
     CategoryResponse
@@ -17,9 +28,32 @@ from app.schemas.product import (
 
 router = APIRouter()
 
+_categories_adapter = TypeAdapter(List[CategoryResponse])
+
+# Built once at import time - raising the same instance avoids
+# re-allocating the exception on every failed lookup
+_product_not_found = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="Product not found"
+)
+
+
+def _weak_etag(payload) -> str:
+    """Build a weak ETag from the serialized response body.
+
+    Hashing the body itself keeps the tag valid across worker processes
+    and restarts - a version counter reset to zero would let an old tag
+    alias fresh content and 304 stale clients indefinitely.
+    """
+    if isinstance(payload, str):
+        payload = payload.encode()
+    digest = hashlib.md5(payload).hexdigest()[:16]
+    return f'W/"{digest}"'
+
 
 @router.get("/", response_model=ProductListResponse)
-async def get_products(
+def get_products(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by category"),
     brand: Optional[str] = Query(None, description="Filter by brand"),
     min_price: Optional[float] = Query(None, ge=0, description="Minimum price"),
@@ -32,58 +66,79 @@ async def get_products(
     db: Session = Depends(get_db)
 ):
     """Get all active products with filtering and pagination."""
-    
-    # Build query
-    query = db.query(Product).filter(Product.is_active == True)
-    
-    # Apply filters
-    if category:
-        query = query.filter(Product.category.ilike(f"%{category}%"))
-    
-    if brand:
-        query = query.filter(Product.brand.ilike(f"%{brand}%"))
-    
-    if min_price is not None:
-        query = query.filter(Product.price >= min_price)
-    
-    if max_price is not None:
-        query = query.filter(Product.price <= max_price)
-    
-    if in_stock is not None:
-        if in_stock:
-            query = query.filter(Product.stock_quantity > 0)
-        else:
-            query = query.filter(Product.stock_quantity == 0)
-    
-    # Apply sorting
-    if hasattr(Product, sort_by):
-        order_column = getattr(Product, sort_by)
-        if sort_order == "desc":
-            query = query.order_by(order_column.desc())
+
+    # Products only change through admin mutations, so identical reads
+    # between catalog versions can be served from the response cache
+    version = get_catalog_version()
+    cache_key = (
+        "products", version, category, brand, min_price, max_price,
+        in_stock, sort_by, sort_order, page, size
+    )
+
+    payload = cache_get(response_cache, cache_key)
+    if payload is None:
+        # Build query over the plain table - list pages are read-only,
+        # so skipping ORM instrumentation keeps row fetches cheap. The
+        # shared filter builder keeps the statement shape identical to
+        # the service layer for compiled-cache hits.
+        query = db.query(Product.__table__).filter(*listing_filters(
+            category=category,
+            brand=brand,
+            min_price=min_price,
+            max_price=max_price,
+            in_stock=in_stock
+        ))
+
+        # Apply sorting
+        if hasattr(Product, sort_by):
+            order_column = getattr(Product, sort_by)
+            if sort_order == "desc":
+                query = query.order_by(order_column.desc())
+            else:
+                query = query.order_by(order_column.asc())
+
+        # Fetch page and total in a single round trip via a window function
+        offset = (page - 1) * size
+        rows = query.add_columns(
+            func.count().over().label('total')
+        ).offset(offset).limit(size).all()
+
+        if rows:
+            products = [row._mapping for row in rows]
+            total = rows[0].total
         else:
-            query = query.order_by(order_column.asc())
-    
-    # Get total count
-    total = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * size
-    products = query.offset(offset).limit(size).all()
-    
-    # Calculate total pages
-    pages = (total + size - 1) // size
-    
-    return ProductListResponse(
-        items=products,
-        total=total,
-        page=page,
-        size=size,
-        pages=pages
+            products = []
+            # A page past the end returns no rows, so count separately
+            total = query.count() if page > 1 else 0
+
+        # Calculate total pages
+        pages = (total + size - 1) // size
+
+        # Cache the serialized body so repeat hits skip both the DB
+        # query and Pydantic serialization. The adapter batch-validates
+        # the page; model_construct skips re-validating it.
+        payload = ProductListResponse.model_construct(
+            items=PRODUCT_LIST_ADAPTER.validate_python(products, from_attributes=True),
+            total=total,
+            page=page,
+            size=size,
+            pages=pages
+        ).model_dump_json()
+        cache_set(response_cache, cache_key, payload)
+
+    etag = _weak_etag(payload)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag}
     )
 
 
 @router.get("/search", response_model=ProductListResponse)
-async def search_products(
+def search_products(
     q: str = Query(..., min_length=1, description="Search query"),
     category: Optional[str] = Query(None, description="Filter by category"),
     brand: Optional[str] = Query(None, description="Filter by brand"),
@@ -94,81 +149,106 @@ async def search_products(
     db: Session = Depends(get_db)
 ):
     """Search products by name and description."""
-    
-    # Build search query
-    search_filter = or_(
-        Product.name.ilike(f"%{q}%"),
-        Product.description.ilike(f"%{q}%")
-    )
-    
-    query = db.query(Product).filter(
-        and_(
-            Product.is_active == True,
-            search_filter
+
+    # Build search filter - GIN-indexed tsvector match on PostgreSQL,
+    # ILIKE elsewhere and for very short queries
+    use_fts = fts_enabled(db, q)
+    if use_fts:
+        search_filter = fts_match(q)
+    else:
+        pattern = ilike_pattern(q)
+        search_filter = or_(
+            Product.name.ilike(pattern),
+            Product.description.ilike(pattern)
+        )
+
+    # Query the plain table - search pages are read-only rows
+    query = db.query(Product.__table__).filter(
+        search_filter,
+        *listing_filters(
+            category=category,
+            brand=brand,
+            min_price=min_price,
+            max_price=max_price
         )
     )
-    
-    # Apply additional filters
-    if category:
-        query = query.filter(Product.category.ilike(f"%{category}%"))
-    
-    if brand:
-        query = query.filter(Product.brand.ilike(f"%{brand}%"))
-    
-    if min_price is not None:
-        query = query.filter(Product.price >= min_price)
-    
-    if max_price is not None:
-        query = query.filter(Product.price <= max_price)
-    
-    # Order by relevance (products with name matches first)
-    query = query.order_by(
-        Product.name.ilike(f"%{q}%").desc(),
+
+    # Order by relevance (ts_rank on the full-text path, name matches
+    # first on the ILIKE path). Selecting the match as a labelled column
+    # lets the database compute it once per row instead of re-evaluating
+    # it for the sort key
+    if use_fts:
+        relevance = fts_rank(q).label("relevance")
+    else:
+        relevance = Product.name.ilike(pattern).label("relevance")
+    query = query.add_columns(relevance).order_by(
+        relevance.desc(),
         Product.created_at.desc()
     )
-    
-    # Get total count
-    total = query.count()
-    
-    # Apply pagination
+
+    # Fetch page and total in a single round trip via a window function
     offset = (page - 1) * size
-    products = query.offset(offset).limit(size).all()
-    
+    rows = query.add_columns(
+        func.count().over().label('total')
+    ).offset(offset).limit(size).all()
+
+    if rows:
+        products = [row._mapping for row in rows]
+        total = rows[0].total
+    else:
+        products = []
+        total = query.count() if page > 1 else 0
+
     # Calculate total pages
     pages = (total + size - 1) // size
-    
-    return ProductListResponse(
-        items=products,
+
+    # Serialize here and return the body directly so FastAPI does not
+    # re-validate the response model
+    payload = ProductListResponse.model_construct(
+        items=PRODUCT_LIST_ADAPTER.validate_python(products, from_attributes=True),
         total=total,
         page=page,
         size=size,
         pages=pages
-    )
+    ).model_dump_json()
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/categories", response_model=List[CategoryResponse])
-async def get_categories(db: Session = Depends(get_db)):
+def get_categories(request: Request, db: Session = Depends(get_db)):
     """Get all available product categories with product counts."""
-    
-    categories = db.query(
-        Product.category,
-        func.count(Product.id).label('count')
-    ).filter(
-        and_(
-            Product.is_active == True,
-            Product.category.isnot(None),
-            Product.category != ""
-        )
-    ).group_by(Product.category).all()
-    
-    return [
-        CategoryResponse(name=category, count=count)
-        for category, count in categories
-    ]
+
+    cache_key = ("categories", get_catalog_version())
+
+    payload = cache_get(response_cache, cache_key)
+    if payload is None:
+        # Read the materialized summary instead of re-aggregating the
+        # whole products table
+        categories = db.query(
+            CategoryCount.name,
+            CategoryCount.count
+        ).all()
+
+        payload = _categories_adapter.dump_json([
+            CategoryResponse(name=category, count=count)
+            for category, count in categories
+        ])
+        cache_set(response_cache, cache_key, payload)
+
+    etag = _weak_etag(payload)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
 @router.get("/{product_id}", response_model=ProductResponse)
-async def get_product(
+def get_product(
     product_id: str,
     db: Session = Depends(get_db)
 ):
@@ -182,9 +262,6 @@ async def get_product(
     ).first()
     
     if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found"
-        )
-    
+        raise _product_not_found
+
     return product
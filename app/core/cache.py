@@ -0,0 +1,53 @@
+"""In-process response caching for hot read endpoints.
+
+Product data only changes through the admin mutation endpoints, so
+cached list/category responses are keyed on a monotonically increasing
+catalog version. Mutations bump the version, which makes every stale
+cache entry unreachable without explicit invalidation.
+"""
+
+import threading
+
+from cachetools import TTLCache
+
+# Serialized response bodies keyed by (endpoint, catalog version, params).
+# Every key carries the catalog version, so a generous TTL only bounds
+# memory - stale entries are already unreachable after a mutation
+response_cache: TTLCache = TTLCache(maxsize=512, ttl=300)
+
+# Assembled Excel exports keyed by (catalog version, filters). Entries
+# are whole files, so the cache is kept small
+export_cache: TTLCache = TTLCache(maxsize=8, ttl=300)
+
+# cachetools caches are not thread-safe, and these instances are shared
+# across FastAPI's worker threadpool - TTL expiry mutates internal
+# bookkeeping even on reads, so both directions need the lock
+_cache_lock = threading.RLock()
+
+_catalog_version = 0
+_version_lock = threading.Lock()
+
+
+def cache_get(cache: TTLCache, key, default=None):
+    """Thread-safe read from a shared TTL cache."""
+    with _cache_lock:
+        return cache.get(key, default)
+
+
+def cache_set(cache: TTLCache, key, value) -> None:
+    """Thread-safe write to a shared TTL cache."""
+    with _cache_lock:
+        cache[key] = value
+
+
+def get_catalog_version() -> int:
+    """Get the current catalog version."""
+    return _catalog_version
+
+
+def bump_catalog_version() -> int:
+    """Increment the catalog version after a product mutation."""
+    global _catalog_version
+    with _version_lock:
+        _catalog_version += 1
+        return _catalog_version
@@ -3,8 +3,8 @@
 from functools import lru_cache
 from typing import List, Optional
 
-from pydantic import AnyHttpUrl, validator
-from pydantic_settings import BaseSettings
+from pydantic import AnyHttpUrl, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -40,8 +40,12 @@ class Settings(BaseSettings):
     admin_username: str = "admin"
     admin_email: str = "admin@example.com"
     admin_password: str = "admin123"
+    # Disable when running multiple workers so they do not race on the
+    # default admin insert at startup
+    bootstrap_admin: bool = True
     
-    @validator("backend_cors_origins", pre=True)
+    @field_validator("backend_cors_origins", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v: str | List[str]) -> List[str]:
         """Parse CORS origins from string or list."""
         if isinstance(v, str) and not v.startswith("["):
@@ -55,10 +59,7 @@ class Settings(BaseSettings):
         """Get allowed file extensions as a list."""
         return [ext.strip() for ext in self.allowed_extensions.split(",")]
     
-    class Config:
-        """Pydantic config."""
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
 @lru_cache()
@@ -0,0 +1,10 @@
+"""Shared rate limiter instance.
+
+Lives in its own module so endpoint modules can decorate routes without
+importing app.main (which imports the routers).
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+limiter = Limiter(key_func=get_remote_address)
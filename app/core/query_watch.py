@@ -0,0 +1,52 @@
+"""Dev-only detector for per-request query storms.
+
+Product has no relationships today, so nothing lazy-loads - but the
+moment a related table appears, an innocent list endpoint can start
+issuing one query per row. Counting statements per request and warning
+past a threshold surfaces that in development logs before it ships.
+"""
+
+import logging
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Statements issued by the current request; None outside request scope.
+# A one-element list rather than a plain int: sync endpoints run in the
+# threadpool under a copy of the request context, so in-place mutation
+# is the only write that stays visible to the middleware
+_query_count: ContextVar[Optional[list]] = ContextVar("query_count", default=None)
+
+# A single page fetch plus count and a couple of lookups stays well
+# under this; per-row loading blows past it immediately
+QUERY_WARN_THRESHOLD = 15
+
+
+def install_query_watch(app: FastAPI, engine: Engine) -> None:
+    """Attach the per-request query counter. Debug builds only."""
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _count_query(conn, cursor, statement, parameters, context, executemany):
+        counter = _query_count.get()
+        if counter is not None:
+            counter[0] += 1
+
+    @app.middleware("http")
+    async def _watch_queries(request: Request, call_next):
+        counter = [0]
+        token = _query_count.set(counter)
+        try:
+            response = await call_next(request)
+            if counter[0] >= QUERY_WARN_THRESHOLD:
+                logger.warning(
+                    f"{request.method} {request.url.path} issued {counter[0]} queries - "
+                    "possible N+1 access pattern"
+                )
+            return response
+        finally:
+            _query_count.reset(token)
@@ -1,7 +1,8 @@
 """Security utilities for authentication and password handling."""
 
+import uuid
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from typing import Any, Dict, Union, Optional
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
@@ -10,12 +11,22 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context - Argon2id with OWASP-recommended parameters;
+# bcrypt stays registered so existing hashes verify and get re-hashed on
+# the next successful login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 
 
 def create_access_token(
-    subject: Union[str, Any], expires_delta: Optional[timedelta] = None
+    subject: Union[str, Any],
+    expires_delta: Optional[timedelta] = None,
+    extra_claims: Optional[Dict[str, Any]] = None
 ) -> str:
     """Create JWT access token."""
     if expires_delta:
@@ -24,33 +35,53 @@ def create_access_token(
         expire = datetime.utcnow() + timedelta(
             minutes=settings.access_token_expire_minutes
         )
-    
-    to_encode = {"exp": expire, "sub": str(subject)}
+
+    to_encode = {"exp": expire, "sub": str(subject), "jti": uuid.uuid4().hex}
+    if extra_claims:
+        to_encode.update(extra_claims)
     encoded_jwt = jwt.encode(
         to_encode, settings.secret_key, algorithm=settings.algorithm
     )
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[str]:
-    """Verify JWT token and return subject."""
+def decode_token(token: str) -> Optional[Dict[str, Any]]:
+    """Decode and verify a JWT token, returning its claims."""
     try:
-        payload = jwt.decode(
+        return jwt.decode(
             token, settings.secret_key, algorithms=[settings.algorithm]
         )
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-        return username
     except JWTError:
         return None
 
 
+def verify_token(token: str) -> Optional[str]:
+    """Verify JWT token and return subject."""
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    return payload.get("sub")
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def dummy_verify() -> None:
+    """Run a throwaway hash verification.
+
+    Called when a login names an unknown user so the request costs the
+    same as a real verification and does not leak which usernames exist.
+    """
+    pwd_context.dummy_verify()
+
+
 def get_password_hash(password: str) -> str:
     """Generate password hash."""
     return pwd_context.hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check if a stored hash uses a deprecated scheme."""
+    return pwd_context.needs_update(hashed_password)
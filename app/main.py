@@ -5,17 +5,18 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
+from fastapi.responses import JSONResponse, ORJSONResponse
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import get_settings
+from app.core.limiter import limiter
 from app.core.database import create_tables
 from app.core.security import get_password_hash
 from app.models.admin import Admin
 from app.api.v1 import products, admin
 from app.core.database import SessionLocal
+from app.services.product_service import refresh_category_counts
 
 # Get settings
 settings = get_settings()
@@ -27,22 +28,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Setup rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events for the application."""
     # Startup
     logger.info("Starting up Furniture API")
-    
-    # Create database tables
-    create_tables()
-    
+
+    # Schema is managed by Alembic ('alembic upgrade head' as a deploy
+    # step); create_all stays only as a convenience for the SQLite dev
+    # default so a fresh checkout runs without migrations
+    if settings.database_url.startswith("sqlite"):
+        create_tables()
+
     # Create default admin user if not exists
-    await create_default_admin()
-    
+    if settings.bootstrap_admin:
+        await create_default_admin()
+
+    # Seed the category summary table in case the last process died
+    # between a catalog mutation and its refresh
+    seed_category_counts()
+
     logger.info("Furniture API started successfully")
     
     yield
@@ -75,6 +81,19 @@ async def create_default_admin():
         db.close()
 
 
+def seed_category_counts():
+    """Rebuild the category_counts summary table at startup."""
+    db = SessionLocal()
+    try:
+        refresh_category_counts(db)
+        db.commit()
+    except Exception as e:
+        logger.error(f"Error seeding category counts: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.project_name,
@@ -82,6 +101,9 @@ app = FastAPI(
     description="A complete, production-ready FastAPI backend system for product management",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson serializes the nested list responses much faster than the
+    # stdlib json encoder
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -89,6 +111,13 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Warn about per-request query storms (latent N+1) in development
+if settings.debug:
+    from app.core.database import engine
+    from app.core.query_watch import install_query_watch
+
+    install_query_watch(app, engine)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
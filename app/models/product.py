@@ -1,12 +1,12 @@
 """Product database model."""
 
-import uuid
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, Any, Optional
 
 from sqlalchemy import Column, String, Text, DECIMAL, Integer, Boolean, DateTime, JSON, Index
 from sqlalchemy.sql import func
+from uuid_utils import uuid7
 
 from app.core.database import Base
 
@@ -16,11 +16,13 @@ class Product(Base):
     
     __tablename__ = "products"
     
-    # Primary key - use String for UUID compatibility with SQLite
+    # Primary key - use String for UUID compatibility with SQLite.
+    # Time-ordered UUIDv7 keeps new rows adjacent in the primary key
+    # index, which matters for insert-heavy bulk imports
     id = Column(
-        String(36), 
-        primary_key=True, 
-        default=lambda: str(uuid.uuid4()),
+        String(36),
+        primary_key=True,
+        default=lambda: str(uuid7()),
         index=True
     )
     
@@ -32,6 +34,11 @@ class Product(Base):
     brand = Column(String(100), nullable=True)
     sku = Column(String(100), nullable=True, unique=True, index=True)
     
+    # No relationships yet. When child tables arrive (images, variants),
+    # declare them with relationship(..., lazy="selectin", omit_join=True)
+    # so list endpoints batch-load children via the FK index instead of
+    # lazy-loading one query per row.
+
     # Inventory
     stock_quantity = Column(Integer, default=0, nullable=False)
     
@@ -58,6 +65,32 @@ class Product(Base):
         Index('idx_product_name_category', 'name', 'category'),
         Index('idx_product_price_active', 'price', 'is_active'),
         Index('idx_product_created_at', 'created_at'),
+        # Composite indexes matching the hot list-endpoint filters:
+        # every public query leads with is_active, then narrows by
+        # category/brand or sorts by created_at.
+        Index('ix_product_active_created', 'is_active', created_at.desc()),
+        Index('ix_product_active_category', 'is_active', 'category'),
+        Index('ix_product_active_brand', 'is_active', 'brand'),
+        # Functional indexes backing the case-insensitive equality
+        # filters on category/brand (lower(col) = lower(:value)).
+        Index('ix_product_category_lower', func.lower(category)),
+        Index('ix_product_brand_lower', func.lower(brand)),
+        # Covering index for the export query: filter by is_active plus
+        # optional category/brand, ordered by created_at. Partial on
+        # Postgres since exports rarely include inactive rows.
+        Index(
+            'idx_product_active_cat_brand_created',
+            'is_active', 'category', 'brand', created_at.desc(),
+            postgresql_where=is_active,
+        ),
+        # Price-range browsing only ever sees active rows; the partial
+        # index keeps those scans off the wider (price, is_active)
+        # composite on Postgres.
+        Index(
+            'idx_product_active_price',
+            'price',
+            postgresql_where=is_active,
+        ),
     )
     
     def __repr__(self) -> str:
@@ -91,3 +124,27 @@ class Product(Base):
     def formatted_price(self) -> str:
         """Get formatted price as string."""
         return f"${self.price:.2f}" if self.price else "$0.00"
+
+
+class CategoryCount(Base):
+    """Materialized per-category product counts.
+
+    Summary table behind /products/categories so reads are an O(1)
+    lookup instead of a GROUP BY scan over products. Rebuilt by
+    refresh_category_counts() after catalog mutations.
+    """
+
+    __tablename__ = "category_counts"
+
+    name = Column(String(100), primary_key=True)
+    count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """String representation of CategoryCount."""
+        return f"<CategoryCount(name='{self.name}', count={self.count})>"
@@ -55,6 +55,14 @@ class TokenResponse(BaseModel):
     expires_in: int
 
 
+class UploadAccepted(BaseModel):
+    """Schema for accepted background upload responses."""
+
+    upload_id: UUID
+    filename: str
+    status: str = "processing"
+
+
 class UploadHistoryResponse(BaseModel):
     """Schema for upload history responses."""
     
@@ -62,9 +70,10 @@ class UploadHistoryResponse(BaseModel):
     admin_id: UUID
     admin_username: str
     filename: str
-    total_rows: int
-    successful_rows: int
-    failed_rows: int
+    # The counts are NULL while a background import is still processing
+    total_rows: Optional[int] = None
+    successful_rows: Optional[int] = None
+    failed_rows: Optional[int] = None
     status: str
     error_details: Optional[Dict[str, Any]] = None
     uploaded_at: datetime
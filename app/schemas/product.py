@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator, ConfigDict
 
 
 class ProductBase(BaseModel):
@@ -22,39 +22,30 @@ class ProductBase(BaseModel):
     image_url: Optional[str] = Field(None, description="Product image URL")
     tags: Optional[Dict[str, Any]] = Field(None, description="Product tags and metadata")
     
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v):
-        """Validate product name."""
-        if not v or not v.strip():
+    @model_validator(mode='after')
+    def normalize_fields(self):
+        """Normalize name/category/SKU in a single validator pass.
+
+        One model-level callback instead of a field validator per
+        attribute - these schemas are built for every item of every
+        paginated response. The positive-price rule lives in the
+        Field(gt=0) constraint.
+        """
+        name = self.name.strip()
+        if not name:
             raise ValueError('Product name cannot be empty')
-        return v.strip()
-    
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v):
-        """Normalize category capitalization."""
-        if v:
-            return v.strip().title()
-        return v
-    
-    @field_validator('sku')
-    @classmethod
-    def validate_sku(cls, v):
-        """Validate SKU format."""
-        if v:
-            v = v.strip().upper()
-            if len(v) < 3:
+        self.name = name
+
+        if self.category:
+            self.category = self.category.strip().title()
+
+        if self.sku:
+            sku = self.sku.strip().upper()
+            if len(sku) < 3:
                 raise ValueError('SKU must be at least 3 characters long')
-        return v
-    
-    @field_validator('price')
-    @classmethod
-    def validate_price(cls, v):
-        """Validate price is positive."""
-        if v <= 0:
-            raise ValueError('Price must be positive')
-        return v
+            self.sku = sku
+
+        return self
 
 
 class ProductCreate(ProductBase):
@@ -76,39 +67,30 @@ class ProductUpdate(BaseModel):
     image_url: Optional[str] = None
     tags: Optional[Dict[str, Any]] = None
     
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v):
-        """Validate product name."""
-        if v is not None and (not v or not v.strip()):
-            raise ValueError('Product name cannot be empty')
-        return v.strip() if v else v
-    
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v):
-        """Normalize category capitalization."""
-        if v:
-            return v.strip().title()
-        return v
-    
-    @field_validator('sku')
-    @classmethod
-    def validate_sku(cls, v):
-        """Validate SKU format."""
-        if v:
-            v = v.strip().upper()
-            if len(v) < 3:
+    @model_validator(mode='after')
+    def normalize_fields(self):
+        """Normalize provided name/category/SKU in a single pass.
+
+        Only fields that were actually supplied are touched, so
+        model_dump(exclude_unset=True) semantics are preserved. The
+        positive-price rule lives in the Field(gt=0) constraint.
+        """
+        if self.name is not None:
+            name = self.name.strip()
+            if not name:
+                raise ValueError('Product name cannot be empty')
+            self.name = name
+
+        if self.category:
+            self.category = self.category.strip().title()
+
+        if self.sku:
+            sku = self.sku.strip().upper()
+            if len(sku) < 3:
                 raise ValueError('SKU must be at least 3 characters long')
-        return v
-    
-    @field_validator('price')
-    @classmethod
-    def validate_price(cls, v):
-        """Validate price is positive."""
-        if v is not None and v <= 0:
-            raise ValueError('Price must be positive')
-        return v
+            self.sku = sku
+
+        return self
 
 
 class ProductResponse(ProductBase):
@@ -123,7 +105,7 @@ class ProductResponse(ProductBase):
 
 class ProductListResponse(BaseModel):
     """Schema for paginated product list responses."""
-    
+
     items: List[ProductResponse]
     total: int
     page: int
@@ -131,6 +113,11 @@ class ProductListResponse(BaseModel):
     pages: int
 
 
+# Built once at import time - batch-validates a whole page of ORM rows
+# in pydantic-core instead of constructing items one at a time
+PRODUCT_LIST_ADAPTER = TypeAdapter(List[ProductResponse])
+
+
 class ProductSearchQuery(BaseModel):
     """Schema for product search queries."""
     
@@ -1,26 +1,34 @@
 """Excel file export service for product data."""
 
-import io
 import logging
+import tempfile
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, Optional
 
-import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_get, cache_set, export_cache, get_catalog_version
 from app.models.product import Product
+from app.services.product_service import brand_equals, category_equals
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Header styles, built once at import time
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+
 
 class ExcelExporter:
     """Excel file exporter for product data."""
-    
+
     # Column headers for the Excel export (matching import format)
     COLUMN_HEADERS = [
         'Product Name',      # Column A: name
-        'Description',       # Column B: description  
+        'Description',       # Column B: description
         'Price',            # Column C: price
         'Category',         # Column D: category
         'Brand',            # Column E: brand
@@ -29,110 +37,147 @@ class ExcelExporter:
         'Image URL',        # Column H: image_url
         'Tags',             # Column I: tags
     ]
-    
+
+    # Fixed column widths - write-only worksheets are serialized as rows
+    # are appended, so they cannot be re-scanned to auto-fit afterwards
+    COLUMN_WIDTHS = {
+        'A': 30,  # Product Name
+        'B': 50,  # Description
+        'C': 12,  # Price
+        'D': 20,  # Category
+        'E': 20,  # Brand
+        'F': 15,  # SKU
+        'G': 15,  # Stock Quantity
+        'H': 40,  # Image URL
+        'I': 30,  # Tags
+    }
+
+    # Rows fetched per server-side cursor batch
+    QUERY_BATCH_SIZE = 1000
+
+    # Size of the chunks yielded to the streaming response
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Exports up to this size are assembled in memory; larger ones
+    # spill to a temp file so RAM stays bounded
+    SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
     def __init__(self, db: Session):
         """Initialize exporter with database session."""
         self.db = db
-    
+
     def export_products_to_excel(
-        self, 
+        self,
         include_inactive: bool = False,
         category_filter: Optional[str] = None,
         brand_filter: Optional[str] = None
     ) -> bytes:
-        """Export products to Excel file and return bytes."""
-        
+        """Export products to Excel file and return bytes.
+
+        Assembled files are cached per catalog version and filter set,
+        so repeat exports of an unchanged catalog skip the database and
+        workbook serialization entirely.
+        """
+        cache_key = (get_catalog_version(), include_inactive, category_filter, brand_filter)
+        cached = cache_get(export_cache, cache_key)
+        if cached is None:
+            cached = b"".join(self.export_products_stream(
+                include_inactive=include_inactive,
+                category_filter=category_filter,
+                brand_filter=brand_filter
+            ))
+            cache_set(export_cache, cache_key, cached)
+        return cached
+
+    def export_products_stream(
+        self,
+        include_inactive: bool = False,
+        category_filter: Optional[str] = None,
+        brand_filter: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """Export products to Excel, yielding the file in chunks.
+
+        Rows are streamed from the database in batches and written
+        through an openpyxl write-only workbook, so memory stays
+        constant regardless of catalog size.
+        """
+
         logger.info(f"Exporting products to Excel. Include inactive: {include_inactive}")
-        
+
         try:
             # Build query
             query = self.db.query(Product)
-            
+
             if not include_inactive:
                 query = query.filter(Product.is_active == True)
-                
+
             if category_filter:
-                query = query.filter(Product.category.ilike(f"%{category_filter}%"))
-                
+                query = query.filter(category_equals(category_filter))
+
             if brand_filter:
-                query = query.filter(Product.brand.ilike(f"%{brand_filter}%"))
-            
+                query = query.filter(brand_equals(brand_filter))
+
             # Order by creation date (newest first)
             query = query.order_by(Product.created_at.desc())
-            
-            # Get all products
-            products = query.all()
-            
-            # Convert to list of dictionaries
-            data = []
-            for product in products:
+
+            # Create write-only workbook for streaming row writes
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet('Products')
+
+            for column_letter, width in self.COLUMN_WIDTHS.items():
+                worksheet.column_dimensions[column_letter].width = width
+
+            # Styled header row
+            header_row = []
+            for header in self.COLUMN_HEADERS:
+                cell = WriteOnlyCell(worksheet, value=header)
+                cell.font = _HEADER_FONT
+                cell.fill = _HEADER_FILL
+                header_row.append(cell)
+            worksheet.append(header_row)
+
+            # Stream rows from the database in batches instead of
+            # materializing the whole result set. Eager loads are
+            # incompatible with yield_per and nothing here needs them.
+            exported_count = 0
+            for product in query.enable_eagerloads(False).yield_per(self.QUERY_BATCH_SIZE):
                 # Convert tags JSON to comma-separated string
                 tags_str = ""
                 if product.tags and isinstance(product.tags, dict) and "tags" in product.tags:
                     tags_str = ", ".join(product.tags["tags"])
-                
-                data.append({
-                    'Product Name': product.name,
-                    'Description': product.description or "",
-                    'Price': float(product.price) if product.price else 0,
-                    'Category': product.category or "",
-                    'Brand': product.brand or "",
-                    'SKU': product.sku or "",
-                    'Stock Quantity': product.stock_quantity or 0,
-                    'Image URL': product.image_url or "",
-                    'Tags': tags_str,
-                })
-            
-            # Create DataFrame
-            df = pd.DataFrame(data, columns=self.COLUMN_HEADERS)
-            
-            # Create Excel file in memory
-            excel_buffer = io.BytesIO()
-            
-            with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-                # Write data to Excel
-                df.to_excel(writer, sheet_name='Products', index=False, header=True)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Products']
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    # Set column width with some padding
-                    adjusted_width = min(max_length + 2, 50)  # Max width of 50
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # Add some formatting to headers
-                from openpyxl.styles import Font, PatternFill
-                
-                header_font = Font(bold=True, color="FFFFFF")
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                
-                for cell in worksheet[1]:  # First row (headers)
-                    cell.font = header_font
-                    cell.fill = header_fill
-            
-            excel_buffer.seek(0)
-            excel_content = excel_buffer.getvalue()
-            
-            logger.info(f"Successfully exported {len(products)} products to Excel")
-            return excel_content
-            
+
+                worksheet.append((
+                    product.name,
+                    product.description or "",
+                    float(product.price) if product.price else 0,
+                    product.category or "",
+                    product.brand or "",
+                    product.sku or "",
+                    product.stock_quantity or 0,
+                    product.image_url or "",
+                    tags_str,
+                ))
+                exported_count += 1
+
+            # Assemble the workbook into a spooled temp file and hand it
+            # out in chunks - typical catalogs stay in memory, oversized
+            # ones spill to disk instead of growing the heap
+            with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE) as excel_file:
+                workbook.save(excel_file)
+                excel_file.seek(0)
+
+                logger.info(f"Successfully exported {exported_count} products to Excel")
+
+                while True:
+                    chunk = excel_file.read(self.STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+
         except Exception as e:
             logger.error(f"Failed to export products to Excel: {str(e)}")
             raise Exception(f"Failed to generate Excel file: {str(e)}")
-    
+
     def generate_filename(self, include_inactive: bool = False) -> str:
         """Generate a filename for the exported Excel file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1,19 +1,150 @@
 """Product service for business logic."""
 
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from decimal import Decimal
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import and_, or_, func, insert, literal_column, select, update
 
-from app.models.product import Product
+from app.core.cache import bump_catalog_version, cache_get, cache_set, get_catalog_version, response_cache
+from app.models.product import CategoryCount, Product
 from app.schemas.product import ProductCreate, ProductUpdate, ProductSearchQuery
 
 
+@lru_cache(maxsize=4096)
+def ilike_pattern(term: str) -> str:
+    """Build (and cache) the %term% wildcard pattern for a search term."""
+    return f"%{term}%"
+
+
+# Queries shorter than this stay on the ILIKE path - full-text search
+# tokenizes on words, so very short strings would miss the substring
+# matches users expect
+FTS_MIN_QUERY_LENGTH = 3
+
+
+def fts_enabled(db: Session, term: str) -> bool:
+    """Whether the PostgreSQL full-text path applies to this search.
+
+    Other dialects have no search_vector column (migration 0005 is
+    Postgres-only) and fall back to ILIKE.
+    """
+    return (
+        db.get_bind().dialect.name == "postgresql"
+        and len(term.strip()) >= FTS_MIN_QUERY_LENGTH
+    )
+
+
+def fts_match(term: str):
+    """GIN-indexed match against the generated search_vector column.
+
+    websearch_to_tsquery understands quoted phrases, OR and -exclusions,
+    and degrades to plain AND matching for simple queries.
+    """
+    return literal_column("search_vector").op("@@")(
+        func.websearch_to_tsquery("spanish", term)
+    )
+
+
+def fts_rank(term: str):
+    """Relevance ordering expression for the full-text path.
+
+    Normalization flag 1 divides the rank by 1 + log(document length),
+    so long descriptions do not outrank short, focused matches.
+    """
+    return func.ts_rank(
+        literal_column("search_vector"),
+        func.websearch_to_tsquery("spanish", term),
+        1
+    )
+
+
+def category_equals(value: str):
+    """Case-insensitive category equality, backed by the lower() index."""
+    return func.lower(Product.category) == value.strip().lower()
+
+
+def brand_equals(value: str):
+    """Case-insensitive brand equality, backed by the lower() index."""
+    return func.lower(Product.brand) == value.strip().lower()
+
+
+def listing_filters(
+    include_inactive: bool = False,
+    category: Optional[str] = None,
+    brand: Optional[str] = None,
+    min_price: Optional[Decimal] = None,
+    max_price: Optional[Decimal] = None,
+    in_stock: Optional[bool] = None
+) -> list:
+    """Build the optional-filter list shared by the product listings.
+
+    One builder keeps every caller producing the same statement shape,
+    so SQLAlchemy's compiled-statement cache gets hits across the list
+    endpoints and the service instead of near-duplicate queries.
+    """
+
+    filters = []
+
+    if not include_inactive:
+        filters.append(Product.is_active == True)
+
+    if category:
+        filters.append(category_equals(category))
+
+    if brand:
+        filters.append(brand_equals(brand))
+
+    if min_price is not None:
+        filters.append(Product.price >= min_price)
+
+    if max_price is not None:
+        filters.append(Product.price <= max_price)
+
+    if in_stock is not None:
+        if in_stock:
+            filters.append(Product.stock_quantity > 0)
+        else:
+            filters.append(Product.stock_quantity == 0)
+
+    return filters
+
+
+def refresh_category_counts(db: Session) -> None:
+    """Rebuild the category_counts summary table from products.
+
+    Bulk imports write through Core inserts that bypass ORM events, so
+    the summary is rebuilt wholesale after catalog mutations instead of
+    being maintained incrementally. The caller owns the commit.
+    """
+
+    db.query(CategoryCount).delete(synchronize_session=False)
+    db.execute(
+        insert(CategoryCount).from_select(
+            ["name", "count"],
+            select(Product.category, func.count(Product.id))
+            .where(
+                and_(
+                    Product.is_active == True,
+                    Product.category.isnot(None),
+                    Product.category != ""
+                )
+            )
+            .group_by(Product.category)
+        )
+    )
+
+
 class ProductService:
     """Service class for product-related business logic."""
-    
+
+    # Ids per IN clause in bulk updates - keeps statements under the
+    # database's bind-parameter limits
+    BULK_ID_CHUNK = 10_000
+
     def __init__(self, db: Session):
         """Initialize service with database session."""
         self.db = db
@@ -22,15 +153,26 @@ class ProductService:
         """Create a new product."""
         
         # Convert to dict and create product
-        product_dict = product_data.dict()
+        product_dict = product_data.model_dump()
         product = Product(**product_dict)
         
         self.db.add(product)
         self.db.commit()
+        self._after_catalog_mutation()
         self.db.refresh(product)
-        
+
         return product
     
+    def _after_catalog_mutation(self) -> None:
+        """Refresh the category summary and invalidate cached reads.
+
+        Called after a committed catalog change - bumping the catalog
+        version makes every version-keyed cache entry unreachable.
+        """
+        refresh_category_counts(self.db)
+        self.db.commit()
+        bump_catalog_version()
+
     def get_product_by_id(self, product_id: UUID, include_inactive: bool = False) -> Optional[Product]:
         """Get product by ID."""
         
@@ -63,34 +205,29 @@ class ProductService:
         in_stock: Optional[bool] = None,
         sort_by: str = "created_at",
         sort_order: str = "desc"
-    ) -> tuple[List[Product], int]:
-        """Get products with filtering and pagination."""
-        
-        # Build base query
-        query = self.db.query(Product)
-        
-        if not include_inactive:
-            query = query.filter(Product.is_active == True)
-        
-        # Apply filters
-        if category:
-            query = query.filter(Product.category.ilike(f"%{category}%"))
-        
-        if brand:
-            query = query.filter(Product.brand.ilike(f"%{brand}%"))
-        
-        if min_price is not None:
-            query = query.filter(Product.price >= min_price)
-        
-        if max_price is not None:
-            query = query.filter(Product.price <= max_price)
-        
-        if in_stock is not None:
-            if in_stock:
-                query = query.filter(Product.stock_quantity > 0)
-            else:
-                query = query.filter(Product.stock_quantity == 0)
-        
+    ) -> tuple[List[Any], int]:
+        """Get products with filtering and pagination.
+
+        Read-only listing: rows come back as plain mappings over the
+        table instead of ORM entities, skipping identity-map and
+        instrumentation overhead. They validate through Pydantic with
+        from_attributes like the list endpoints.
+        """
+
+        # Build query over the plain table with the shared filter set
+        query = self.db.query(Product.__table__)
+
+        filters = listing_filters(
+            include_inactive=include_inactive,
+            category=category,
+            brand=brand,
+            min_price=min_price,
+            max_price=max_price,
+            in_stock=in_stock
+        )
+        if filters:
+            query = query.filter(*filters)
+
         # Apply sorting
         if hasattr(Product, sort_by):
             order_column = getattr(Product, sort_by)
@@ -99,12 +236,20 @@ class ProductService:
             else:
                 query = query.order_by(order_column.asc())
         
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination
-        products = query.offset(skip).limit(limit).all()
-        
+        # Fetch page and total in a single round trip via a window
+        # function instead of issuing the filter twice
+        rows = query.add_columns(
+            func.count().over().label('total')
+        ).offset(skip).limit(limit).all()
+
+        if rows:
+            products = [row._mapping for row in rows]
+            total = rows[0].total
+        else:
+            products = []
+            # A page past the end returns no rows, so count separately
+            total = query.count() if skip > 0 else 0
+
         return products, total
     
     def search_products(
@@ -116,47 +261,59 @@ class ProductService:
         brand: Optional[str] = None,
         min_price: Optional[Decimal] = None,
         max_price: Optional[Decimal] = None
-    ) -> tuple[List[Product], int]:
-        """Search products by name and description."""
-        
-        # Build search filter
-        search_filter = or_(
-            Product.name.ilike(f"%{search_query}%"),
-            Product.description.ilike(f"%{search_query}%")
-        )
-        
-        query = self.db.query(Product).filter(
-            and_(
-                Product.is_active == True,
-                search_filter
+    ) -> tuple[List[Any], int]:
+        """Search products by name and description.
+
+        Like get_products, results are plain row mappings rather than
+        ORM entities.
+        """
+
+        # Build search filter - tsvector on PostgreSQL, ILIKE elsewhere
+        # and for very short queries
+        use_fts = fts_enabled(self.db, search_query)
+        if use_fts:
+            search_filter = fts_match(search_query)
+        else:
+            pattern = ilike_pattern(search_query)
+            search_filter = or_(
+                Product.name.ilike(pattern),
+                Product.description.ilike(pattern)
+            )
+
+        query = self.db.query(Product.__table__).filter(
+            search_filter,
+            *listing_filters(
+                category=category,
+                brand=brand,
+                min_price=min_price,
+                max_price=max_price
             )
         )
-        
-        # Apply additional filters
-        if category:
-            query = query.filter(Product.category.ilike(f"%{category}%"))
-        
-        if brand:
-            query = query.filter(Product.brand.ilike(f"%{brand}%"))
-        
-        if min_price is not None:
-            query = query.filter(Product.price >= min_price)
-        
-        if max_price is not None:
-            query = query.filter(Product.price <= max_price)
-        
-        # Order by relevance (name matches first)
-        query = query.order_by(
-            Product.name.ilike(f"%{search_query}%").desc(),
+
+        # Order by relevance. The labelled column lets the database
+        # evaluate the match expression once per row rather than
+        # re-running it for the sort key
+        if use_fts:
+            relevance = fts_rank(search_query).label("relevance")
+        else:
+            relevance = Product.name.ilike(pattern).label("relevance")
+        query = query.add_columns(relevance).order_by(
+            relevance.desc(),
             Product.created_at.desc()
         )
-        
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination
-        products = query.offset(skip).limit(limit).all()
-        
+
+        # Fetch page and total in a single round trip via a window function
+        rows = query.add_columns(
+            func.count().over().label('total')
+        ).offset(skip).limit(limit).all()
+
+        if rows:
+            products = [row._mapping for row in rows]
+            total = rows[0].total
+        else:
+            products = []
+            total = query.count() if skip > 0 else 0
+
         return products, total
     
     def update_product(self, product_id: UUID, product_data: ProductUpdate) -> Optional[Product]:
@@ -167,13 +324,13 @@ class ProductService:
             return None
         
         # Update fields
-        update_data = product_data.dict(exclude_unset=True)
+        update_data = product_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(product, field, value)
-        
+
         self.db.commit()
-        self.db.refresh(product)
-        
+        self._after_catalog_mutation()
+
         return product
     
     def delete_product(self, product_id: UUID, soft_delete: bool = True) -> bool:
@@ -191,69 +348,151 @@ class ProductService:
             # Hard delete - remove from database
             self.db.delete(product)
             self.db.commit()
-        
+
+        self._after_catalog_mutation()
         return True
     
     def get_categories(self) -> List[Dict[str, Any]]:
-        """Get all available categories with product counts."""
-        
-        categories = self.db.query(
-            Product.category,
-            func.count(Product.id).label('count')
-        ).filter(
-            and_(
-                Product.is_active == True,
-                Product.category.isnot(None),
-                Product.category != ""
-            )
-        ).group_by(Product.category).all()
-        
-        return [
-            {"name": category, "count": count}
-            for category, count in categories
-        ]
-    
+        """Get all available categories with product counts.
+
+        The aggregate only changes with the catalog, so results are
+        cached per catalog version.
+        """
+
+        cache_key = ("service-categories", get_catalog_version())
+        cached = cache_get(response_cache, cache_key)
+        if cached is None:
+            categories = self.db.query(
+                Product.category,
+                func.count(Product.id).label('count')
+            ).filter(
+                and_(
+                    Product.is_active == True,
+                    Product.category.isnot(None),
+                    Product.category != ""
+                )
+            ).group_by(Product.category).all()
+
+            cached = [
+                {"name": category, "count": count}
+                for category, count in categories
+            ]
+            cache_set(response_cache, cache_key, cached)
+
+        return cached
+
     def get_brands(self) -> List[Dict[str, Any]]:
-        """Get all available brands with product counts."""
-        
-        brands = self.db.query(
-            Product.brand,
-            func.count(Product.id).label('count')
-        ).filter(
-            and_(
-                Product.is_active == True,
-                Product.brand.isnot(None),
-                Product.brand != ""
-            )
-        ).group_by(Product.brand).all()
-        
-        return [
-            {"name": brand, "count": count}
-            for brand, count in brands
-        ]
+        """Get all available brands with product counts.
+
+        Cached per catalog version, like get_categories.
+        """
+
+        cache_key = ("service-brands", get_catalog_version())
+        cached = cache_get(response_cache, cache_key)
+        if cached is None:
+            brands = self.db.query(
+                Product.brand,
+                func.count(Product.id).label('count')
+            ).filter(
+                and_(
+                    Product.is_active == True,
+                    Product.brand.isnot(None),
+                    Product.brand != ""
+                )
+            ).group_by(Product.brand).all()
+
+            cached = [
+                {"name": brand, "count": count}
+                for brand, count in brands
+            ]
+            cache_set(response_cache, cache_key, cached)
+
+        return cached
     
     def update_stock(self, product_id: UUID, quantity: int) -> Optional[Product]:
-        """Update product stock quantity."""
-        
-        product = self.db.query(Product).filter(Product.id == product_id).first()
-        if not product:
+        """Update product stock quantity.
+
+        One UPDATE ... RETURNING statement both applies the change and
+        reads back the row, instead of a fetch-modify-commit sequence.
+        """
+
+        product = self.db.execute(
+            update(Product)
+            .where(Product.id == product_id)
+            .values(stock_quantity=quantity)
+            .returning(Product)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+
+        if product is None:
+            self.db.rollback()
             return None
-        
-        product.stock_quantity = quantity
+
+        # RETURNING hands back the identity-mapped instance without
+        # refreshing attributes it already loaded; record the new value
+        # directly instead of expiring and re-selecting
+        set_committed_value(product, "stock_quantity", quantity)
+
         self.db.commit()
-        self.db.refresh(product)
-        
+        # Stock does not change category counts, but cached listings
+        # filter on it
+        bump_catalog_version()
+
         return product
+
+    def bulk_update_stock(self, stock_updates: List[Tuple[UUID, int]]) -> int:
+        """Apply (product_id, quantity) pairs in one executemany.
+
+        For stock sync jobs - avoids one UPDATE round trip per product.
+        """
+
+        if not stock_updates:
+            return 0
+
+        mappings = [
+            {"id": product_id, "stock_quantity": quantity}
+            for product_id, quantity in stock_updates
+        ]
+        for start in range(0, len(mappings), self.BULK_ID_CHUNK):
+            self.db.bulk_update_mappings(Product, mappings[start:start + self.BULK_ID_CHUNK])
+
+        self.db.commit()
+        bump_catalog_version()
+        return len(mappings)
     
     def bulk_update_status(self, product_ids: List[UUID], is_active: bool) -> int:
         """Bulk update product status."""
-        
-        updated_count = self.db.query(Product).filter(
-            Product.id.in_(product_ids)
-        ).update(
-            {"is_active": is_active},
-            synchronize_session=False
-        )
-        
+
+        # Chunk the id list so very large batches stay within the
+        # database's parameter limits
+        updated_count = 0
+        for start in range(0, len(product_ids), self.BULK_ID_CHUNK):
+            updated_count += self.db.query(Product).filter(
+                Product.id.in_(product_ids[start:start + self.BULK_ID_CHUNK])
+            ).update(
+                {"is_active": is_active},
+                synchronize_session=False
+            )
+
         self.db.commit()
+        self._after_catalog_mutation()
         return updated_count
+
+    def bulk_update_products(self, updates: List[Dict[str, Any]]) -> int:
+        """Apply per-row updates in a single executemany statement.
+
+        Each mapping must carry the product 'id' plus the fields to
+        change. Unlike bulk_update_status, values may differ per row;
+        bulk_update_mappings compresses them into one executemany
+        instead of one UPDATE per product.
+        """
+
+        if not updates:
+            return 0
+
+        for start in range(0, len(updates), self.BULK_ID_CHUNK):
+            self.db.bulk_update_mappings(Product, updates[start:start + self.BULK_ID_CHUNK])
+
+        self.db.commit()
+        self._after_catalog_mutation()
+        return len(updates)
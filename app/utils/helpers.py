@@ -10,6 +10,33 @@ from urllib.parse import urlparse
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import time - these helpers run per cell in
+# Excel imports, so the per-call re-cache lookup adds up
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_DECIMAL_CLEAN_RE = re.compile(r'[^\d.-]')
+_INT_CLEAN_RE = re.compile(r'[^\d-]')
+
+# Quantize targets built once - Decimal construction per call is pure
+# overhead, and quantize itself is skipped when the value already has
+# the requested scale
+_QUANTIZERS = {p: Decimal(10) ** -p for p in range(0, 9)}
+
+# Translation tables do character stripping in one C-level pass instead
+# of a regex scan or chained str methods
+_WHITESPACE_DELETE = str.maketrans('', '', ' \t\n\r')
+
+
+class _KeepAsciiLetters(dict):
+    """translate() table that deletes everything but A-Z and a-z."""
+
+    def __missing__(self, code):
+        return None
+
+
+_LETTERS_ONLY = _KeepAsciiLetters(
+    {code: code for code in (*range(65, 91), *range(97, 123))}
+)
+
 
 def validate_url(url: str) -> bool:
     """Validate if a string is a valid URL."""
@@ -22,8 +49,7 @@ def validate_url(url: str) -> bool:
 
 def validate_email(email: str) -> bool:
     """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def sanitize_string(value: str, max_length: Optional[int] = None) -> str:
@@ -48,19 +74,27 @@ def parse_decimal(value: Any, precision: int = 2) -> Optional[Decimal]:
     
     try:
         if isinstance(value, str):
-            # Remove any non-numeric characters except decimal point and minus
-            cleaned = re.sub(r'[^\d.-]', '', value)
-            if not cleaned:
-                return None
-            value = cleaned
-        
-        decimal_value = Decimal(str(value))
-        
-        # Round to specified precision
-        if precision >= 0:
-            quantize_value = Decimal('0.' + '0' * precision)
-            decimal_value = decimal_value.quantize(quantize_value)
+            # Fast path: clean numeric strings convert directly; only
+            # fall back to regex stripping for values with currency
+            # symbols, separators etc.
+            try:
+                decimal_value = Decimal(value)
+            except InvalidOperation:
+                cleaned = _DECIMAL_CLEAN_RE.sub('', value)
+                if not cleaned:
+                    return None
+                decimal_value = Decimal(cleaned)
+        else:
+            decimal_value = Decimal(str(value))
         
+        # Round to specified precision, skipping the quantize when the
+        # value already carries that exact scale
+        if precision >= 0 and -decimal_value.as_tuple().exponent != precision:
+            quantizer = _QUANTIZERS.get(precision)
+            if quantizer is None:
+                quantizer = Decimal(10) ** -precision
+            decimal_value = decimal_value.quantize(quantizer)
+
         return decimal_value
         
     except (InvalidOperation, ValueError, TypeError):
@@ -74,12 +108,15 @@ def parse_integer(value: Any) -> Optional[int]:
     
     try:
         if isinstance(value, str):
-            # Remove any non-numeric characters except minus
-            cleaned = re.sub(r'[^\d-]', '', value)
-            if not cleaned:
-                return None
-            value = cleaned
-        
+            # Fast path: plain integer strings skip the regex cleaning
+            try:
+                return int(value)
+            except ValueError:
+                cleaned = _INT_CLEAN_RE.sub('', value)
+                if not cleaned:
+                    return None
+                value = cleaned
+
         return int(float(value))
         
     except (ValueError, TypeError):
@@ -103,8 +140,8 @@ def normalize_sku(sku: str) -> str:
     if not sku:
         return ""
     
-    # Convert to uppercase and remove spaces
-    return sku.strip().upper().replace(" ", "")
+    # Convert to uppercase and remove whitespace
+    return sku.upper().translate(_WHITESPACE_DELETE)
 
 
 def parse_tags(tags_input: Any) -> Optional[Dict[str, List[str]]]:
@@ -148,27 +185,30 @@ def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     """Format datetime for display."""
     if dt is None:
         return ""
-    
+
+    # Fast path for the default format - an f-string avoids strftime
+    # re-parsing the format string on every call
+    if format_str == "%Y-%m-%d %H:%M:%S":
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        )
+
     return dt.strftime(format_str)
 
 
 def calculate_pagination(total: int, page: int, size: int) -> Dict[str, int]:
     """Calculate pagination metadata."""
-    if size <= 0:
-        size = 20
-    
-    if page <= 0:
-        page = 1
-    
-    pages = (total + size - 1) // size
-    offset = (page - 1) * size
-    
+    size = size if size > 0 else 20
+    page = page if page > 0 else 1
+    pages = -(-total // size)
+
     return {
         "total": total,
         "page": page,
         "size": size,
         "pages": pages,
-        "offset": offset,
+        "offset": (page - 1) * size,
         "has_next": page < pages,
         "has_prev": page > 1
     }
@@ -186,10 +226,10 @@ def validate_file_extension(filename: str, allowed_extensions: List[str]) -> boo
 def generate_sku(name: str, category: str = "", sequence: int = 1) -> str:
     """Generate a SKU from product name and category."""
     # Take first 3 characters of name (letters only)
-    name_part = re.sub(r'[^a-zA-Z]', '', name.upper())[:3].ljust(3, 'X')
-    
+    name_part = name.upper().translate(_LETTERS_ONLY)[:3].ljust(3, 'X')
+
     # Take first 2 characters of category (letters only)
-    category_part = re.sub(r'[^a-zA-Z]', '', category.upper())[:2].ljust(2, 'X')
+    category_part = category.upper().translate(_LETTERS_ONLY)[:2].ljust(2, 'X')
     
     # Add sequence number
     sequence_part = f"{sequence:04d}"
@@ -213,45 +253,80 @@ def mask_sensitive_data(data: Dict[str, Any], sensitive_fields: List[str]) -> Di
 
 
 class ErrorCollector:
-    """Helper class to collect and manage validation errors."""
-    
+    """Helper class to collect and manage validation errors.
+
+    Records are kept as parallel lists of fields, messages and rows
+    instead of one dict per entry - during large imports the per-dict
+    heap overhead dominates, and the dict form is only needed when a
+    summary is requested.
+    """
+
     def __init__(self):
         """Initialize error collector."""
-        self.errors: List[Dict[str, Any]] = []
-        self.warnings: List[Dict[str, Any]] = []
-    
+        self._err_fields: List[str] = []
+        self._err_messages: List[str] = []
+        self._err_rows: List[Optional[int]] = []
+        self._warn_fields: List[str] = []
+        self._warn_messages: List[str] = []
+        self._warn_rows: List[Optional[int]] = []
+
+    @staticmethod
+    def _materialize(
+        fields: List[str],
+        messages: List[str],
+        rows: List[Optional[int]]
+    ) -> List[Dict[str, Any]]:
+        """Build the dict-per-record form on demand."""
+        return [
+            {"field": field, "message": message, "row": row}
+            if row is not None else {"field": field, "message": message}
+            for field, message, row in zip(fields, messages, rows)
+        ]
+
+    @property
+    def errors(self) -> List[Dict[str, Any]]:
+        """Collected errors as a list of dicts."""
+        return self._materialize(self._err_fields, self._err_messages, self._err_rows)
+
+    @property
+    def warnings(self) -> List[Dict[str, Any]]:
+        """Collected warnings as a list of dicts."""
+        return self._materialize(self._warn_fields, self._warn_messages, self._warn_rows)
+
     def add_error(self, field: str, message: str, row: Optional[int] = None) -> None:
         """Add an error."""
-        error_dict = {"field": field, "message": message}
-        if row is not None:
-            error_dict["row"] = row
-        self.errors.append(error_dict)
-    
+        self._err_fields.append(field)
+        self._err_messages.append(message)
+        self._err_rows.append(row)
+
     def add_warning(self, field: str, message: str, row: Optional[int] = None) -> None:
         """Add a warning."""
-        warning_dict = {"field": field, "message": message}
-        if row is not None:
-            warning_dict["row"] = row
-        self.warnings.append(warning_dict)
-    
+        self._warn_fields.append(field)
+        self._warn_messages.append(message)
+        self._warn_rows.append(row)
+
     def has_errors(self) -> bool:
         """Check if there are any errors."""
-        return len(self.errors) > 0
-    
+        return len(self._err_fields) > 0
+
     def has_warnings(self) -> bool:
         """Check if there are any warnings."""
-        return len(self.warnings) > 0
-    
+        return len(self._warn_fields) > 0
+
     def get_error_summary(self) -> Dict[str, Any]:
         """Get summary of errors and warnings."""
         return {
-            "error_count": len(self.errors),
-            "warning_count": len(self.warnings),
+            "error_count": len(self._err_fields),
+            "warning_count": len(self._warn_fields),
             "errors": self.errors,
             "warnings": self.warnings
         }
-    
+
     def clear(self) -> None:
         """Clear all errors and warnings."""
-        self.errors.clear()
-        self.warnings.clear()
+        self._err_fields.clear()
+        self._err_messages.clear()
+        self._err_rows.clear()
+        self._warn_fields.clear()
+        self._warn_messages.clear()
+        self._warn_rows.clear()
@@ -1,8 +1,9 @@
 """Crea un archivo Excel de muestra para importar productos (catálogo en español, precios CLP)."""
 
-import pandas as pd
 import random
 
+from openpyxl import Workbook
+
 # Datos de productos de muestra
 data = [
     ["Sofá Moderno", "Sofá de 3 plazas con tela premium y diseño contemporáneo", 459990, "Muebles", "ConfortChile", "SOF001", 8, f"https://picsum.photos/id/{random.randint(1, 100)}/200/300", "moderno,cómodo,sala de estar"],
@@ -15,8 +16,7 @@ data = [
     ["Puf", "Puf grande para sala de estar, ideal para relajarse", 49990, "Muebles", "ConfortChile", "PUF001", 15, f"https://picsum.photos/id/{random.randint(1, 100)}/200/300", "relajación,comodidad,casual"],
 ]
 
-# Crear DataFrame
-df = pd.DataFrame(data, columns=[
+headers = [
     "Nombre del Producto",
     "Descripción",
     "Precio (CLP)",
@@ -25,11 +25,17 @@ df = pd.DataFrame(data, columns=[
     "SKU",
     "Stock",
     "URL Imagen",
-    "Etiquetas"
-])
+    "Etiquetas",
+]
 
-# Guardar en Excel
-df.to_excel("catalogo_productos_clp.xlsx", index=False, header=True)
+# Escribir directamente con openpyxl - no hace falta cargar pandas para
+# serializar un puñado de filas
+workbook = Workbook(write_only=True)
+worksheet = workbook.create_sheet("Productos")
+worksheet.append(headers)
+for row in data:
+    worksheet.append(row)
+workbook.save("catalogo_productos_clp.xlsx")
 
 print("¡Archivo Excel 'catalogo_productos_clp.xlsx' creado exitosamente!")
 print("\nEl archivo contiene los siguientes productos:")
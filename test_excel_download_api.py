@@ -1,22 +1,23 @@
 """Test the Excel download API endpoint."""
 
-import requests
-import json
+import asyncio
 from datetime import datetime
 
+import httpx
 
-def test_admin_login():
+
+async def test_admin_login(client):
     """Test admin login and get access token."""
     login_url = "http://localhost:8000/api/v1/admin/login"
-    
+
     # Try to login with default admin credentials
     login_data = {
         "username": "admin",
         "password": "admin123"
     }
-    
-    response = requests.post(login_url, data=login_data)
-    
+
+    response = await client.post(login_url, data=login_data)
+
     if response.status_code == 200:
         token_data = response.json()
         return token_data["access_token"]
@@ -25,80 +26,69 @@ def test_admin_login():
         return None
 
 
-def test_excel_download(access_token):
-    """Test the Excel download endpoint."""
+async def download_and_save(client, headers, params, label, prefix):
+    """Download one Excel export and save it to a timestamped file."""
     download_url = "http://localhost:8000/api/v1/admin/download-excel"
-    
-    headers = {
-        "Authorization": f"Bearer {access_token}"
-    }
-    
-    # Test 1: Download active products only
-    print("📥 Testing download of active products...")
-    response = requests.get(download_url, headers=headers)
-    
-    if response.status_code == 200:
-        filename = f"downloaded_active_products_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        with open(filename, 'wb') as f:
-            f.write(response.content)
-        print(f"✅ Active products downloaded successfully: {filename}")
-        print(f"📊 File size: {len(response.content)} bytes")
-    else:
-        print(f"❌ Download failed: {response.status_code} - {response.text}")
-        return
-    
-    # Test 2: Download all products (including inactive)
-    print("\n📥 Testing download of all products (including inactive)...")
-    params = {"include_inactive": True}
-    response = requests.get(download_url, headers=headers, params=params)
-    
-    if response.status_code == 200:
-        filename = f"downloaded_all_products_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        with open(filename, 'wb') as f:
-            f.write(response.content)
-        print(f"✅ All products downloaded successfully: {filename}")
-        print(f"📊 File size: {len(response.content)} bytes")
-    else:
-        print(f"❌ Download failed: {response.status_code} - {response.text}")
-        return
-    
-    # Test 3: Download with category filter
-    print("\n📥 Testing download with category filter...")
-    params = {"category": "Sillas"}
-    response = requests.get(download_url, headers=headers, params=params)
-    
+
+    response = await client.get(download_url, headers=headers, params=params)
+
     if response.status_code == 200:
-        filename = f"downloaded_category_filter_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        filename = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         with open(filename, 'wb') as f:
             f.write(response.content)
-        print(f"✅ Category filtered products downloaded successfully: {filename}")
+        print(f"✅ {label} downloaded successfully: {filename}")
         print(f"📊 File size: {len(response.content)} bytes")
     else:
         print(f"❌ Download failed: {response.status_code} - {response.text}")
 
 
-def main():
+async def test_excel_download(client, access_token):
+    """Test the Excel download endpoint."""
+    headers = {
+        "Authorization": f"Bearer {access_token}"
+    }
+
+    # The three downloads are independent, so they run concurrently
+    print("📥 Testing downloads: active products, all products (including inactive), category filter...")
+    await asyncio.gather(
+        download_and_save(
+            client, headers, None,
+            "Active products", "downloaded_active_products"
+        ),
+        download_and_save(
+            client, headers, {"include_inactive": True},
+            "All products", "downloaded_all_products"
+        ),
+        download_and_save(
+            client, headers, {"category": "Sillas"},
+            "Category filtered products", "downloaded_category_filter"
+        )
+    )
+
+
+async def main():
     """Main test function."""
     print("🧪 Testing Excel Download API Endpoint")
     print("=" * 50)
-    
-    # First, test login
-    print("🔐 Testing admin login...")
-    access_token = test_admin_login()
-    
-    if not access_token:
-        print("❌ Cannot proceed without valid access token")
-        return
-    
-    print("✅ Login successful!")
-    print(f"🎫 Access token: {access_token[:20]}...")
-    
-    # Test Excel download
-    print("\n" + "=" * 50)
-    test_excel_download(access_token)
-    
+
+    async with httpx.AsyncClient() as client:
+        # First, test login
+        print("🔐 Testing admin login...")
+        access_token = await test_admin_login(client)
+
+        if not access_token:
+            print("❌ Cannot proceed without valid access token")
+            return
+
+        print("✅ Login successful!")
+        print(f"🎫 Access token: {access_token[:20]}...")
+
+        # Test Excel download
+        print("\n" + "=" * 50)
+        await test_excel_download(client, access_token)
+
     print("\n🎉 All tests completed!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())